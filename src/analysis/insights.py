@@ -2,6 +2,13 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import uuid
+from collections.abc import Iterator
+from pathlib import Path
+
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import AzureChatOpenAI
 from pydantic import BaseModel, Field
@@ -45,6 +52,70 @@ _PROMPT = ChatPromptTemplate.from_messages(
 )
 
 
+def _prompt_inputs(article: Article, max_article_chars: int) -> dict[str, str]:
+    body = article.markdown or article.snippet or ""
+    if len(body) > max_article_chars:
+        body = body[:max_article_chars] + "\n\n[... truncated ...]"
+    return {
+        "title": article.title,
+        "source": article.source,
+        "url": str(article.url),
+        "body": body,
+    }
+
+
+def _to_analysis(payload: _InsightPayload) -> ArticleAnalysis:
+    insights = [str(b).strip() for b in (payload.insights or []) if str(b).strip()]
+    return ArticleAnalysis(insights=insights)
+
+
+def insight_cache_key(llm: AzureChatOpenAI, article: Article, *, max_article_chars: int) -> str:
+    """Exact-match key for one insight call: everything that shapes the
+    completion, i.e. the deployment, temperature, both prompt templates, the
+    structured-output schema (its field descriptions reach the model) and
+    the rendered inputs (URL, title, source and truncated body). Any change
+    to these misses the cache, so a hit is always the same request."""
+    material = json.dumps(
+        {
+            "deployment": getattr(llm, "deployment_name", None),
+            "temperature": getattr(llm, "temperature", None),
+            "system": _SYSTEM_PROMPT,
+            "user": _USER_TEMPLATE,
+            "schema": _InsightPayload.model_json_schema(),
+            "inputs": _prompt_inputs(article, max_article_chars),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def read_insight_cache(cache_dir: Path, key: str) -> ArticleAnalysis | None:
+    try:
+        raw = (Path(cache_dir) / f"{key}.json").read_text(encoding="utf-8")
+    except OSError:
+        return None
+    try:
+        return ArticleAnalysis.model_validate_json(raw)
+    except ValueError:
+        # Corrupt or from an older schema — treat as a miss and overwrite.
+        return None
+
+
+def write_insight_cache(cache_dir: Path, key: str, analysis: ArticleAnalysis) -> Path:
+    """Write atomically: a temp file in the same directory, then `replace`,
+    so a concurrent reader sees either the old entry or the full new one.
+    Raises `OSError` on failure; the temp file is removed first."""
+    p = Path(cache_dir) / f"{key}.json"
+    tmp = p.with_name(f"{key}.{uuid.uuid4().hex}.tmp")
+    try:
+        tmp.write_text(analysis.model_dump_json(), encoding="utf-8")
+        os.replace(tmp, p)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+    return p
+
+
 def generate_insights(
     llm: AzureChatOpenAI,
     article: Article,
@@ -52,21 +123,42 @@ def generate_insights(
     max_article_chars: int,
 ) -> ArticleAnalysis:
     """Run the per-article insight prompt and return a parsed `ArticleAnalysis`."""
-    body = article.markdown or article.snippet or ""
-    if len(body) > max_article_chars:
-        body = body[:max_article_chars] + "\n\n[... truncated ...]"
-
     structured_llm = llm.with_structured_output(_InsightPayload)
     chain = _PROMPT | structured_llm
 
-    payload: _InsightPayload = chain.invoke(
-        {
-            "title": article.title,
-            "source": article.source,
-            "url": str(article.url),
-            "body": body,
-        }
-    )
+    payload: _InsightPayload = chain.invoke(_prompt_inputs(article, max_article_chars))
+    return _to_analysis(payload)
 
-    insights = [str(b).strip() for b in (payload.insights or []) if str(b).strip()]
-    return ArticleAnalysis(insights=insights)
+
+def generate_insights_batch(
+    llm: AzureChatOpenAI,
+    articles: list[Article],
+    *,
+    max_article_chars: int,
+    max_concurrency: int,
+) -> Iterator[tuple[int, ArticleAnalysis | Exception]]:
+    """Run the insight prompt for every article through one `chain.batch`
+    dispatch, yielding `(index, result)` as each call completes. `index`
+    refers to the position in `articles`, whatever the dispatch order.
+
+    A failed call yields its exception in place of the analysis rather than
+    aborting the batch, so callers can degrade per article.
+    """
+    structured_llm = llm.with_structured_output(_InsightPayload)
+    chain = _PROMPT | structured_llm
+
+    inputs = [_prompt_inputs(a, max_article_chars) for a in articles]
+    # Longest bodies first: completion latency grows with prompt size, so
+    # starting the slow calls early keeps one long article from running
+    # alone at the tail of the batch once the short ones have drained.
+    order = sorted(range(len(inputs)), key=lambda i: len(inputs[i]["body"]), reverse=True)
+    for pos, payload in chain.batch_as_completed(
+        [inputs[i] for i in order],
+        config={"max_concurrency": max(1, max_concurrency)},
+        return_exceptions=True,
+    ):
+        idx = order[pos]
+        if isinstance(payload, Exception):
+            yield idx, payload
+        else:
+            yield idx, _to_analysis(payload)
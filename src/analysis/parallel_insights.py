@@ -1,17 +1,28 @@
 """Parallel LLM insight generation across the selected articles.
 
-`AzureChatOpenAI` is thread-safe (it's an HTTP wrapper), so we fan out
-per-article calls through a `ThreadPoolExecutor`. Failures attach an
-empty `ArticleAnalysis` and are recorded into `degradation`.
+All per-article prompts go out through a single LangChain `batch` call,
+which dispatches them concurrently (bounded by `workers`) against the one
+shared `AzureChatOpenAI`. Failures attach an empty `ArticleAnalysis` and
+are recorded into `degradation`.
+
+With a `cache_dir`, each prompt is first looked up by an exact hash of the
+request (see `insight_cache_key`); only misses go to the LLM, and
+non-empty completions are written back for the next run. A failed cache
+write is recorded as a warning and never aborts the stage.
 """
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 
 from langchain_openai import AzureChatOpenAI
 
-from src.analysis.insights import generate_insights
+from src.analysis.insights import (
+    generate_insights_batch,
+    insight_cache_key,
+    read_insight_cache,
+    write_insight_cache,
+)
 from src.models import ArticleAnalysis, DegradationStatus, ScoredArticle
 
 
@@ -23,6 +34,7 @@ def generate_insights_parallel(
     workers: int,
     degradation: DegradationStatus,
     on_progress: callable | None = None,
+    cache_dir: Path | None = None,
 ) -> list[ScoredArticle]:
     """Generate insights for every article concurrently.
 
@@ -31,29 +43,54 @@ def generate_insights_parallel(
     if not selected:
         return []
 
-    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="llm") as exe:
-        future_to_sa = {
-            exe.submit(
-                generate_insights,
-                llm,
-                sa.article,
-                max_article_chars=max_article_chars,
-            ): sa
-            for sa in selected
-        }
-        completed = 0
-        for fut in as_completed(future_to_sa):
-            sa = future_to_sa[fut]
-            completed += 1
-            try:
-                sa.analysis = fut.result()
-            except Exception as exc:  # noqa: BLE001
-                degradation.record_attempt(success=False)
-                degradation.add_warning(
-                    f"Insight generation failed for '{sa.article.title[:60]}': {exc}"
-                )
-                sa.analysis = ArticleAnalysis(insights=[])
-            if on_progress is not None:
-                on_progress(completed, len(selected))
+    completed = 0
+    keys: dict[int, str] = {}
+    misses: list[int] = []
+    for i, sa in enumerate(selected):
+        if cache_dir is None:
+            misses.append(i)
+            continue
+        key = insight_cache_key(llm, sa.article, max_article_chars=max_article_chars)
+        cached = read_insight_cache(cache_dir, key)
+        if cached is None:
+            keys[i] = key
+            misses.append(i)
+            continue
+        sa.analysis = cached
+        completed += 1
+        if on_progress is not None:
+            on_progress(completed, len(selected))
+
+    if not misses:
+        return selected
+
+    for pos, result in generate_insights_batch(
+        llm,
+        [selected[i].article for i in misses],
+        max_article_chars=max_article_chars,
+        max_concurrency=workers,
+    ):
+        idx = misses[pos]
+        sa = selected[idx]
+        completed += 1
+        if isinstance(result, Exception):
+            degradation.record_attempt(success=False)
+            degradation.add_warning(
+                f"Insight generation failed for '{sa.article.title[:60]}': {result}"
+            )
+            sa.analysis = ArticleAnalysis(insights=[])
+        else:
+            sa.analysis = result
+            # Empty completions aren't cached, so the next run retries them
+            # instead of pinning "No analysis available" for the article.
+            if idx in keys and result.insights:
+                try:
+                    write_insight_cache(cache_dir, keys[idx], result)
+                except OSError as exc:
+                    degradation.add_warning(
+                        f"Could not cache insights for '{sa.article.title[:60]}': {exc}"
+                    )
+        if on_progress is not None:
+            on_progress(completed, len(selected))
 
     return selected
@@ -17,7 +17,7 @@ class BlockType(StrEnum):
     UNKNOWN = "unknown"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BlockClassification:
     type: BlockType
     retryable: bool
@@ -64,7 +64,7 @@ def classify_status(status: int | None) -> BlockClassification:
 
 def classify_text(body: str | None) -> BlockClassification:
     """Detect CAPTCHA-style challenge pages from body text."""
-    if not body or not body.strip():
+    if not body or body.isspace():
         return BlockClassification(
             BlockType.EMPTY_BODY, retryable=True, rotate_user_agent=True, reason="empty body"
         )
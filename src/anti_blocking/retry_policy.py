@@ -43,7 +43,7 @@ class RetryExhausted(Exception):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AttemptResult(Generic[T]):
     result: T | None
     classification: BlockClassification
@@ -3,7 +3,9 @@
 Writes one event per line to `Output/retry_logs/<session_id>_retry_log.jsonl`.
 Append-only: each `log_event` appends a single line, so the file is safe
 to read while a run is in flight and doesn't grow O(N²) in disk traffic
-the way a "rewrite the whole array" implementation would.
+the way a "rewrite the whole array" implementation would. The file is
+opened once and held for the session; each line is flushed as written.
+Use the logger as a context manager (or call `close`) to release it.
 
 The logger is thread-safe: the `BrowserPool`'s worker threads and the
 LLM `ThreadPoolExecutor` may all log concurrently. A single lock guards
@@ -15,20 +17,38 @@ from __future__ import annotations
 import json
 import threading
 import uuid
+from contextlib import AbstractContextManager
 from datetime import datetime
 from pathlib import Path
+from types import TracebackType
 from typing import Any
 
+# One encoder for every event: `json.dumps(..., default=str)` builds a fresh
+# JSONEncoder per call, since any non-default argument skips the cached one.
+_ENCODER = json.JSONEncoder(default=str)
 
-class SessionLogger:
+
+class SessionLogger(AbstractContextManager["SessionLogger"]):
     def __init__(self, output_dir: Path, session_id: str | None = None) -> None:
         self.session_id = session_id or datetime.now().strftime("%Y%m%d_%H%M%S_") + uuid.uuid4().hex[:6]
         self.log_dir = Path(output_dir) / "retry_logs"
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self.log_path = self.log_dir / f"{self.session_id}_retry_log.jsonl"
         self._lock = threading.Lock()
-        # Touch the file so consumers see it even before the first event.
-        self.log_path.touch()
+        # Opening creates the file, so consumers see it before the first event.
+        self._file = self.log_path.open("a", encoding="utf-8")
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
 
     def log_event(self, event_type: str, **fields: Any) -> None:
         event = {
@@ -37,9 +57,10 @@ class SessionLogger:
             "event": event_type,
             **fields,
         }
-        line = json.dumps(event, default=str) + "\n"
-        with self._lock, self.log_path.open("a", encoding="utf-8") as f:
-            f.write(line)
+        line = _ENCODER.encode(event) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
 
     def log_retry(
         self,
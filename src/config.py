@@ -71,6 +71,14 @@ class SourceSettings:
     tier_1_multiplier: float
     tier_2_multiplier: float
     tier_3_multiplier: float
+    # Set views of the tier lists for `classify_tier`'s membership checks,
+    # built once when the settings are constructed.
+    tier_1_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    tier_2_set: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "tier_1_set", frozenset(self.tier_1))
+        object.__setattr__(self, "tier_2_set", frozenset(self.tier_2))
 
 
 @dataclass(frozen=True)
@@ -8,9 +8,11 @@ worker thread owns its own browser context, so identities stay isolated.
 
 from __future__ import annotations
 
+import calendar
 import re
 from concurrent.futures import as_completed
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from urllib.parse import parse_qs, quote_plus, urlparse
 
 from bs4 import BeautifulSoup
@@ -19,6 +21,7 @@ from playwright.sync_api import BrowserContext
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from src.anti_blocking.session_logger import SessionLogger
+from src.extraction.browser import settle_after_load
 from src.extraction.browser_pool import BrowserPool
 from src.models import Article, Topic
 
@@ -51,13 +54,45 @@ _RELATIVE_TIME = re.compile(
     r"\b(\d+)\s+(minute|hour|day|week|month|year)s?\s+ago\b", re.IGNORECASE
 )
 _ABSOLUTE_DATE = re.compile(
-    r"\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}\b"
+    r"\b((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*)\s+(\d{1,2}),?\s+(\d{4})\b"
 )
+_ISO_DATE = re.compile(r"\b(\d{4})-(\d{2})-(\d{2})\b")
+
+# English month names (abbreviated + full) → month number. Looked up
+# directly instead of trial-parsing with strptime, which is locale-dependent
+# and raises on every format that doesn't match.
+_MONTH_NAMES = (
+    "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december",
+)
+_MONTHS: dict[str, int] = {
+    **{name: i for i, name in enumerate(_MONTH_NAMES, start=1)},
+    **{name[:3]: i for i, name in enumerate(_MONTH_NAMES, start=1)},
+}
+
 _YESTERDAY = re.compile(r"\bYesterday\b", re.IGNORECASE)
 _TODAY = re.compile(r"\bToday\b", re.IGNORECASE)
 
-# Strip these patterns plus separators/punctuation from titles.
-_TITLE_TIME_NOISE = [_RELATIVE_TIME, _ABSOLUTE_DATE, _YESTERDAY, _TODAY]
+# Strip these patterns plus separators/punctuation from titles. Joined into
+# one alternation so a title is scanned once instead of once per pattern;
+# the absolute date keeps its case-sensitive month match via a scoped flag.
+_TITLE_TIME_NOISE = re.compile(
+    "|".join(
+        (
+            _RELATIVE_TIME.pattern,
+            f"(?-i:{_ABSOLUTE_DATE.pattern})",
+            _YESTERDAY.pattern,
+            _TODAY.pattern,
+        )
+    ),
+    re.IGNORECASE,
+)
+
+# Title/snippet tidy-up: separators left behind once time markers are
+# removed, and runs of whitespace. Compiled once rather than looked up in
+# `re`'s pattern cache on every result card.
+_SEPARATORS = re.compile(r"\s*[·•|]\s*")
+_WHITESPACE_RUN = re.compile(r"\s+")
 
 
 def _parse_pub_time(text: str | None, *, now: datetime | None = None) -> datetime | None:
@@ -100,33 +135,41 @@ def _parse_pub_time(text: str | None, *, now: datetime | None = None) -> datetim
 
     abs_m = _ABSOLUTE_DATE.search(text)
     if abs_m:
-        candidate = abs_m.group(0).replace(",", "")
-        for fmt in ("%b %d %Y", "%B %d %Y"):
-            try:
-                return datetime.strptime(candidate, fmt)
-            except ValueError:
-                continue
+        month = _MONTHS.get(abs_m.group(1).lower())
+        if month is not None:
+            parsed = _date_from_parts(int(abs_m.group(3)), month, int(abs_m.group(2)))
+            if parsed is not None:
+                return parsed
 
-    iso_m = re.search(r"\b\d{4}-\d{2}-\d{2}\b", text)
+    iso_m = _ISO_DATE.search(text)
     if iso_m:
-        try:
-            return datetime.strptime(iso_m.group(0), "%Y-%m-%d")
-        except ValueError:
-            pass
+        return _date_from_parts(int(iso_m.group(1)), int(iso_m.group(2)), int(iso_m.group(3)))
 
     return None
 
 
+@lru_cache(maxsize=4096)
+def _date_from_parts(year: int, month: int, day: int) -> datetime | None:
+    """Midnight `datetime` for the given parts, or None if they don't form a
+    real calendar date. Validated up front rather than via try/except.
+
+    Memoised: a month's worth of result cards repeats the same few dozen
+    dates, and the returned `datetime` is immutable so sharing it is safe."""
+    if not (datetime.min.year <= year <= datetime.max.year and 1 <= month <= 12):
+        return None
+    if not 1 <= day <= calendar.monthrange(year, month)[1]:
+        return None
+    return datetime(year, month, day)
+
+
 def _strip_time_from_title(title: str) -> str:
     """Remove relative/absolute time markers from a title and tidy spacing."""
     if not title:
         return ""
-    cleaned = title
-    for pat in _TITLE_TIME_NOISE:
-        cleaned = pat.sub("", cleaned)
+    cleaned = _TITLE_TIME_NOISE.sub("", title)
     # Collapse separators left behind ("Title ·  · ago" → "Title")
-    cleaned = re.sub(r"\s*[·•|]\s*", " ", cleaned)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip(" .,;-—")
+    cleaned = _SEPARATORS.sub(" ", cleaned)
+    cleaned = _WHITESPACE_RUN.sub(" ", cleaned).strip(" .,;-—")
     return cleaned
 
 
@@ -141,7 +184,7 @@ def _scrape_query_in_context(
             page.goto(search_url, wait_until="domcontentloaded", timeout=30_000)
         except PlaywrightTimeoutError:
             return ""
-        page.wait_for_timeout(1_500)  # let the result list settle
+        settle_after_load(page, timeout_ms=1_500)  # let the result list settle
         return page.content()
     finally:
         try:
@@ -229,14 +272,18 @@ class GoogleNewsDiscoverer:
 
 
 # Pulled out as a free function so it can be unit-tested without a browser.
-def parse_google_news_html(html: str) -> list[dict]:
+def parse_google_news_html(html: str, *, now: datetime | None = None) -> list[dict]:
     """Parse Google News result cards out of raw HTML.
 
     Google does not publish a stable DOM for these results; we cast a wide
     net by walking each anchor that points to an external URL and
     collecting nearby text. Intentionally tolerant so small layout changes
     don't break discovery.
+
+    `now` anchors relative times ("3 days ago"). It is read once per page,
+    so every card on the page is dated against the same instant.
     """
+    now = now or datetime.now()
     soup = BeautifulSoup(html, "lxml")
     results: list[dict] = []
     seen_urls: set[str] = set()
@@ -267,36 +314,38 @@ def parse_google_news_html(html: str) -> list[dict]:
         if len(title) < 8:
             continue
 
-        # Walk up to find a result container with source/snippet/time.
+        # Walk up to find a result container with source/snippet/time. The
+        # text of the last container visited is kept, so the final block is
+        # not flattened a second time once the walk stops.
         container = a
+        block_text: str | None = None
         for _ in range(5):
             if container.parent is None:
                 break
             container = container.parent
-            text = container.get_text(" ", strip=True)
-            if len(text) >= len(raw_title) + 30:
+            block_text = container.get_text(" ", strip=True)
+            if len(block_text) >= len(raw_title) + 30:
                 break
 
-        block_text = container.get_text(" ", strip=True)
-        published_time = _parse_pub_time(block_text)
+        if block_text is None:
+            block_text = container.get_text(" ", strip=True)
+        published_time = _parse_pub_time(block_text, now=now)
 
         # Snippet: full container text minus the title prefix and time markers.
         snippet = block_text
         if raw_title in snippet:
             snippet = snippet.split(raw_title, 1)[-1].strip()
-        for pat in _TITLE_TIME_NOISE:
-            snippet = pat.sub("", snippet)
-        snippet = re.sub(r"\s+", " ", snippet).strip(" .,;-—·•|")[:400]
+        snippet = _TITLE_TIME_NOISE.sub("", snippet)
+        snippet = _WHITESPACE_RUN.sub(" ", snippet).strip(" .,;-—·•|")[:400]
 
         # Source heuristic: text before a separator, with time stripped.
         source = ""
         head = block_text
         if raw_title in head:
             head = head.split(raw_title, 1)[0]
-        for pat in _TITLE_TIME_NOISE:
-            head = pat.sub("", head)
-        head = re.sub(r"\s*[·•|]\s*", " ", head)
-        head = re.sub(r"\s+", " ", head).strip(" .,;-—")
+        head = _TITLE_TIME_NOISE.sub("", head)
+        head = _SEPARATORS.sub(" ", head)
+        head = _WHITESPACE_RUN.sub(" ", head).strip(" .,;-—")
         if 2 < len(head) < 60 and head.lower() != title.lower():
             source = head
 
@@ -2,28 +2,45 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 from src.config import SourceSettings
 from src.models import SourceTier
 
 
+def _suffixes(domain: str) -> Iterator[str]:
+    """Yield `domain` and each parent at a label boundary: a.b.c, b.c, c."""
+    yield domain
+    dot = domain.find(".")
+    while dot != -1:
+        domain = domain[dot + 1 :]
+        yield domain
+        dot = domain.find(".")
+
+
 def classify_tier(domain: str, sources: SourceSettings) -> SourceTier:
-    """Map a domain (e.g. 'ft.com') to its source-reliability tier."""
+    """Map a domain (e.g. 'ft.com') to its source-reliability tier.
+
+    Walks the domain's label suffixes against set-backed tier lists, so the
+    cost scales with label depth rather than with the length of the lists.
+    """
     if not domain:
         return SourceTier.TIER_3
     d = domain.lower().removeprefix("www.")
 
-    for tier_1 in sources.tier_1:
-        if d == tier_1 or d.endswith("." + tier_1):
-            return SourceTier.TIER_1
-    for tier_2 in sources.tier_2:
-        if d == tier_2 or d.endswith("." + tier_2):
-            return SourceTier.TIER_2
+    if any(s in sources.tier_1_set for s in _suffixes(d)):
+        return SourceTier.TIER_1
+    if any(s in sources.tier_2_set for s in _suffixes(d)):
+        return SourceTier.TIER_2
     return SourceTier.TIER_3
 
 
 def tier_multiplier(tier: SourceTier, sources: SourceSettings) -> float:
-    return {
-        SourceTier.TIER_1: sources.tier_1_multiplier,
-        SourceTier.TIER_2: sources.tier_2_multiplier,
-        SourceTier.TIER_3: sources.tier_3_multiplier,
-    }[tier]
+    match tier:
+        case SourceTier.TIER_1:
+            return sources.tier_1_multiplier
+        case SourceTier.TIER_2:
+            return sources.tier_2_multiplier
+        case SourceTier.TIER_3:
+            return sources.tier_3_multiplier
+    raise ValueError(f"Unknown source tier: {tier!r}")
@@ -5,7 +5,10 @@ from the legacy template. Copy strings are tuned for an investment-banking
 audience reading a monthly briefing.
 """
 
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from html import escape
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +16,68 @@ from docx import Document
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 from docx.shared import Inches, Pt
 
+# docx lengths used by the renderers. `Length` is an immutable int, so one
+# instance per value is shared rather than rebuilt on every paragraph.
+_PT = {size: Pt(size) for size in (3, 6, 10, 11, 12, 14, 16)}
+_MARGIN = Inches(1)
+_TOC_INDENT = Inches(0.25)
+_BULLET_INDENT = Inches(0.4)
+
+
+@lru_cache(maxsize=256)
+def _format_iso_date(value: str) -> str:
+    """String branch of `DocumentGenerator._format_pub_date`. Memoised because
+    the docx and email renderers format the same `published_time` strings
+    in the same run."""
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return dt.strftime("%B %d, %Y")
+    except (ValueError, TypeError):
+        return value
+
+
+@dataclass(frozen=True, slots=True)
+class _ArticleView:
+    """One renderable article with placeholders already applied and its
+    insights normalised to a bullet list."""
+
+    title: str
+    source: str
+    pub_date: str
+    url: str
+    insights: tuple[str, ...]
+
+
+# Per-article card in the email body. Only the fields in braces vary, so the
+# static markup is a module constant filled with `str.format` per article.
+# Callers HTML-escape every field: titles and sources come from scraped pages.
+_EMAIL_ARTICLE_CARD = """\
+        <!-- Article {i} -->
+        <tr>
+            <td class="article-item">
+                <table class="article-table" cellpadding="0" cellspacing="0" role="presentation">
+                    <tr>
+                        <td class="article-accent-cell" style="width: 6px; background-color: #E9041E; font-size: 1px; line-height: 1px;">&nbsp;</td>
+                        <td class="article-content-cell {content_bg_class}">
+                            <p class="article-title">
+                                <a href="{url}" target="_blank">{i}. {title}</a>
+                            </p>
+                            <p class="article-meta">
+                                {source} &bull; {pub_time}
+                            </p>
+                            <div class="article-insights">
+                                {processed_insights_html}
+                            </div>
+                            <p class="read-more-link" style="margin-top: 12px; margin-bottom: 0;">
+                                <a href="{url}" target="_blank">Read Full Article &rarr;</a>
+                            </p>
+                        </td>
+                    </tr>
+                </table>
+            </td>
+        </tr>
+            """
+
 
 class DocumentGenerator:
     def __init__(
@@ -32,10 +97,10 @@ class DocumentGenerator:
     def _set_doc_margins(self, document):
         sections = document.sections
         for section in sections:
-            section.top_margin = Inches(1)
-            section.bottom_margin = Inches(1)
-            section.left_margin = Inches(1)
-            section.right_margin = Inches(1)
+            section.top_margin = _MARGIN
+            section.bottom_margin = _MARGIN
+            section.left_margin = _MARGIN
+            section.right_margin = _MARGIN
 
     def _add_styled_paragraph(
         self, document, text, size=11, bold=False, alignment=WD_PARAGRAPH_ALIGNMENT.LEFT
@@ -44,9 +109,9 @@ class DocumentGenerator:
         paragraph.alignment = alignment
         run = paragraph.add_run(text)
         run.font.name = "Calibri"
-        run.font.size = Pt(size)
+        run.font.size = _PT.get(size) or Pt(size)
         run.bold = bold
-        paragraph.paragraph_format.space_after = Pt(6)
+        paragraph.paragraph_format.space_after = _PT[6]
         return paragraph
 
     @staticmethod
@@ -60,28 +125,43 @@ class DocumentGenerator:
             return "Date unknown"
         if isinstance(pub_time_str, datetime):
             return pub_time_str.strftime("%B %d, %Y")
-        try:
-            dt = datetime.fromisoformat(str(pub_time_str).replace("Z", "+00:00"))
-            return dt.strftime("%B %d, %Y")
-        except (ValueError, TypeError):
-            return str(pub_time_str)
+        return _format_iso_date(str(pub_time_str))
 
     @staticmethod
-    def _normalize_insights(insights: Any) -> list[str]:
+    def _normalize_insights(insights: Any) -> tuple[str, ...]:
         """Coerce any of {list[str], '•'-separated string, plain string, None}
-        to a clean list of bullet strings. Empty input → empty list."""
+        to a clean tuple of bullet strings. Empty input → empty tuple."""
         if isinstance(insights, list):
-            return [str(b).strip() for b in insights if str(b).strip()]
+            return tuple(str(b).strip() for b in insights if str(b).strip())
         if isinstance(insights, str) and insights.strip():
             text = insights.strip()
             if "•" in text:
-                return [p.strip() for p in text.split("•") if p.strip()]
-            return [text]
-        return []
+                return tuple(p.strip() for p in text.split("•") if p.strip())
+            return (text,)
+        return ()
+
+    @classmethod
+    def _project(cls, top_articles: list[dict]) -> list[_ArticleView]:
+        """Flatten renderable dicts into `_ArticleView`s, filling the
+        placeholders both renderers show for missing fields. Done once per
+        document so the TOC and detail passes share the same lookups."""
+        views = []
+        for item in top_articles:
+            article = item.get("article", {})
+            analysis = item.get("analysis", {})
+            views.append(
+                _ArticleView(
+                    title=article.get("title", "No Title Provided"),
+                    source=article.get("source", "Unknown Source"),
+                    pub_date=cls._format_pub_date(article.get("published_time")),
+                    url=article.get("url", "#"),
+                    insights=cls._normalize_insights(analysis.get("insights")),
+                )
+            )
+        return views
 
-    def _render_insight_bullets(self, document, insights: Any) -> None:
-        """Render insights as bulleted paragraphs in the docx."""
-        bullets = self._normalize_insights(insights)
+    def _render_insight_bullets(self, document, bullets: tuple[str, ...]) -> None:
+        """Render normalised insight bullets as paragraphs in the docx."""
         if not bullets:
             self._add_styled_paragraph(
                 document, "No analysis available for this article.", size=11
@@ -91,21 +171,20 @@ class DocumentGenerator:
             p = document.add_paragraph()
             run = p.add_run(f"• {b}")
             run.font.name = "Calibri"
-            run.font.size = Pt(11)
-            p.paragraph_format.left_indent = Inches(0.4)
-            p.paragraph_format.space_after = Pt(3)
+            run.font.size = _PT[11]
+            p.paragraph_format.left_indent = _BULLET_INDENT
+            p.paragraph_format.space_after = _PT[3]
 
     @staticmethod
-    def _render_insights_html(insights: Any) -> str:
+    def _render_insights_html(bullets: tuple[str, ...]) -> str:
         """HTML version of bullet rendering for the email path."""
-        bullets = DocumentGenerator._normalize_insights(insights)
         if not bullets:
             return (
                 "<p style='margin: 10px 0 0 0;'>"
                 "No analysis available for this article.</p>"
             )
         items = "".join(
-            f"<li style='margin-bottom: 6px;'>{b}</li>" for b in bullets
+            f"<li style='margin-bottom: 6px;'>{escape(b)}</li>" for b in bullets
         )
         return (
             f"<ul style='margin: 10px 0 0 0; padding-left: 20px;'>{items}</ul>"
@@ -129,7 +208,8 @@ class DocumentGenerator:
         """Generates a detailed Word document report including a table of contents."""
         document = Document()
         self._set_doc_margins(document)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         filename = f"detailed_news_report_{timestamp}.docx"
         filepath = self.output_dir / filename
 
@@ -142,20 +222,21 @@ class DocumentGenerator:
         )
         self._add_styled_paragraph(
             document,
-            f"{self.month_label} • Generated {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+            f"{self.month_label} • Generated {now.strftime('%Y-%m-%d %H:%M')}",
             size=10,
             alignment=WD_PARAGRAPH_ALIGNMENT.CENTER,
         )
         document.add_paragraph()
 
+        views = self._project(top_articles)
+
         # Add Table of Contents
         self._add_styled_paragraph(document, "Table of Contents", size=14, bold=True)
-        for i, item in enumerate(top_articles, 1):
-            title = item.get("article", {}).get("title", "No Title Provided")
+        for i, view in enumerate(views, 1):
             toc_paragraph = self._add_styled_paragraph(
-                document, f"{i}. {title}", size=11
+                document, f"{i}. {view.title}", size=11
             )
-            toc_paragraph.paragraph_format.left_indent = Inches(0.25)
+            toc_paragraph.paragraph_format.left_indent = _TOC_INDENT
         document.add_paragraph()  # Add spacing after TOC
 
         self._add_styled_paragraph(
@@ -173,21 +254,14 @@ class DocumentGenerator:
 
         self._add_styled_paragraph(document, "Top Stories — Detail", size=14, bold=True)
 
-        for i, item in enumerate(top_articles, 1):
-            article = item.get("article", {})
-            analysis = item.get("analysis", {})
-            title = article.get("title", "No Title Provided")
-            source = article.get("source", "Unknown Source")
-            pub_time = self._format_pub_date(article.get("published_time"))
-            url = article.get("url", "#")
-
-            self._add_styled_paragraph(document, f"{i}. {title}", size=12, bold=True)
+        for i, view in enumerate(views, 1):
+            self._add_styled_paragraph(document, f"{i}. {view.title}", size=12, bold=True)
             self._add_styled_paragraph(
-                document, f"{source}  •  {pub_time}", size=10
+                document, f"{view.source}  •  {view.pub_date}", size=10
             )
-            self._render_insight_bullets(document, analysis.get("insights"))
+            self._render_insight_bullets(document, view.insights)
             p = self._add_styled_paragraph(document, "Link: ", size=10)
-            p.add_run(url).font.size = Pt(10)
+            p.add_run(view.url).font.size = _PT[10]
             document.add_paragraph()
 
         document.save(filepath)
@@ -197,8 +271,9 @@ class DocumentGenerator:
         """Generates HTML content ready for copying into Outlook email."""
 
         month_label = self.month_label
+        now = datetime.now()
 
-        html_content = f"""\
+        parts: list[str] = [f"""\
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -383,9 +458,9 @@ class DocumentGenerator:
                     Welcome to your monthly AI briefing, curated for investment banking professionals.
                     This digest highlights the most material developments in AI, AI in banking and finance,
                     and AI agents from {month_label}. Click any article title to read the full story.
-                </p>"""
+                </p>"""]
 
-        html_content += """
+        parts.append("""
                         </p>
                     </td>
                 </tr>
@@ -399,49 +474,26 @@ class DocumentGenerator:
                 <h3>This Month's Top Stories</h3>
                     </td>
                 </tr>
-        """
+        """)
 
         # Add top 3 articles with new styling
-        for i, item in enumerate(top_articles[:3], 1):
-            article = item.get("article", {})
-            analysis = item.get("analysis", {})
-
-            title = article.get("title", "No Title Provided")
-            source = article.get("source", "Unknown Source")
-            pub_time = self._format_pub_date(article.get("published_time"))
-            url = article.get("url", "#")
-
-            processed_insights_html = self._render_insights_html(analysis.get("insights"))
+        for i, view in enumerate(self._project(top_articles[:3]), 1):
+            processed_insights_html = self._render_insights_html(view.insights)
             content_bg_class = "bg-lightgrey" if i % 2 == 0 else "bg-white"
 
-            html_content += f"""\
-        <!-- Article {i} -->
-        <tr>
-            <td class="article-item">
-                <table class="article-table" cellpadding="0" cellspacing="0" role="presentation">
-                    <tr>
-                        <td class="article-accent-cell" style="width: 6px; background-color: #E9041E; font-size: 1px; line-height: 1px;">&nbsp;</td>
-                        <td class="article-content-cell {content_bg_class}">
-                            <p class="article-title">
-                                <a href="{url}" target="_blank">{i}. {title}</a>
-                            </p>
-                            <p class="article-meta">
-                                {source} &bull; {pub_time}
-                            </p>
-                            <div class="article-insights">
-                                {processed_insights_html}
-                            </div>
-                            <p class="read-more-link" style="margin-top: 12px; margin-bottom: 0;">
-                                <a href="{url}" target="_blank">Read Full Article &rarr;</a>
-                            </p>
-                        </td>
-                    </tr>
-                </table>
-            </td>
-        </tr>
-            """
+            parts.append(
+                _EMAIL_ARTICLE_CARD.format(
+                    i=i,
+                    url=escape(view.url),
+                    title=escape(view.title),
+                    source=escape(view.source),
+                    pub_time=escape(view.pub_date),
+                    content_bg_class=content_bg_class,
+                    processed_insights_html=processed_insights_html,
+                )
+            )
 
-        html_content += f"""\
+        parts.append(f"""\
         <!-- Spacer row before footer -->
         <tr><td style="height:10px; background-color: #ffffff; font-size: 1px; line-height: 1px;">&nbsp;</td></tr>
 
@@ -455,18 +507,21 @@ class DocumentGenerator:
                 <p>
                     For feedback or inquiries, please reply to this email.
                 </p>
-                <p style="margin-top:15px; color: #888888;">&copy; {datetime.now().year} {self.company_name}. All rights reserved.</p>
+                <p style="margin-top:15px; color: #888888;">&copy; {now.year} {self.company_name}. All rights reserved.</p>
                                 </td>
                             </tr>
     </table> <!-- End of email-container table -->
 </body>
 </html>
-"""
+""")
 
-        timestamp_file = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp_file = now.strftime("%Y%m%d_%H%M%S")
         filename = f"email_content_{timestamp_file}.html"
         filepath = self.output_dir / filename
 
+        # Fragments are collected in `parts` and joined once, rather than
+        # re-copying the growing document on every `+=`.
+        html_content = "".join(parts)
         with open(filepath, "w", encoding="utf-8") as f:
             f.write(html_content)
 
@@ -514,10 +569,9 @@ class DocumentGenerator:
             analysis = getattr(sa, "analysis", None)
             if article is None:
                 continue
-            insights = []
-            if analysis and getattr(analysis, "insights", None):
-                insights = analysis.insights
+            insights = (getattr(analysis, "insights", None) if analysis else None) or []
             pub_time = getattr(article, "published_time", None)
+            tier = getattr(sa, "source_tier", None)
             ws.append(
                 [
                     i,
@@ -529,7 +583,7 @@ class DocumentGenerator:
                     round(float(getattr(sa, "final_score", 0.0)), 4),
                     round(float(getattr(sa, "topic_relevance", 0.0)), 4),
                     round(float(getattr(sa, "cross_source_consensus", 0.0)), 4),
-                    int(getattr(sa, "source_tier", 3)) if getattr(sa, "source_tier", None) is not None else 3,
+                    int(tier) if tier is not None else 3,
                     round(float(getattr(sa, "source_tier_multiplier", 1.0)), 4),
                     round(float(getattr(sa, "recency", 0.0)), 4),
                     " | ".join(insights),
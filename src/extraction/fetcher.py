@@ -10,8 +10,8 @@ from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from src.anti_blocking.block_detector import (
     BlockClassification,
     BlockType,
-    classify_response,
     classify_status,
+    classify_text,
 )
 from src.anti_blocking.retry_policy import (
     AttemptResult,
@@ -23,7 +23,7 @@ from src.anti_blocking.session_logger import SessionLogger
 from src.extraction.browser import EdgeBrowser
 
 
-@dataclass
+@dataclass(slots=True)
 class PageResult:
     url: str
     final_url: str
@@ -89,7 +89,8 @@ class PageFetcher:
 
             self.browser.jitter_sleep(page, *self.post_load_jitter)
             html = page.content()
-            classification = classify_response(status, html)
+            # Status already passed above; only the body is left to check.
+            classification = classify_text(html)
             if classification.type != BlockType.NONE:
                 return AttemptResult(None, classification)
 
@@ -12,7 +12,8 @@ trimmed off when we build the final list.
 
 from __future__ import annotations
 
-from collections import Counter
+import heapq
+from collections import Counter, deque
 from collections.abc import Callable
 from concurrent.futures import FIRST_COMPLETED, Future, wait
 from dataclasses import dataclass
@@ -24,8 +25,8 @@ from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from src.anti_blocking.block_detector import (
     BlockClassification,
     BlockType,
-    classify_response,
     classify_status,
+    classify_text,
 )
 from src.anti_blocking.retry_policy import (
     AttemptResult,
@@ -42,13 +43,17 @@ from src.extraction.markdown import html_to_markdown, read_cache, write_cache
 from src.models import DegradationStatus, ScoredArticle, Topic
 
 
-@dataclass
+@dataclass(slots=True)
 class _Outcome:
     scored: ScoredArticle
     success: bool
     reason: str = ""
 
 
+def _score_key(sa: ScoredArticle) -> float:
+    return sa.final_score
+
+
 def _is_banking(sa: ScoredArticle) -> bool:
     return Topic.AI_BANKING in sa.article.appeared_in_topics or (
         sa.article.discovered_via_topic == Topic.AI_BANKING
@@ -85,7 +90,8 @@ def _fetch_html_in_context(
 
         settle_after_load(page, timeout_ms=2000)
         html = page.content()
-        cls = classify_response(status, html)
+        # Status already passed above; only the body is left to check.
+        cls = classify_text(html)
         if cls.type != BlockType.NONE:
             return AttemptResult(None, cls)
         return AttemptResult(
@@ -189,28 +195,33 @@ def fetch_and_select(
 
     successes: list[ScoredArticle] = []
     domain_success: Counter[str] = Counter()
+    # Running topic tallies, kept in step with `successes` / `pending`, so the
+    # selection checks after every completion don't rescan both collections.
+    banking_successes = 0
+    banking_pending = 0
     submitted = 0
     failed = 0
     candidate_iter = iter(ranked)
     pending: dict[Future, ScoredArticle] = {}
-    deferred_non_banking: list[ScoredArticle] = []
+    deferred_non_banking: deque[ScoredArticle] = deque()
 
     non_banking_budget = max(0, selection.top_n - selection.ai_banking_minimum_floor)
 
-    def banking_count() -> int:
-        return sum(1 for s in successes if _is_banking(s))
-
-    def banking_in_flight() -> int:
-        return sum(1 for sa in pending.values() if _is_banking(sa))
-
     def non_banking_load() -> int:
         # Successes + in-flight that, on success, would land in non-banking.
-        return (len(successes) - banking_count()) + (len(pending) - banking_in_flight())
+        return (len(successes) - banking_successes) + (len(pending) - banking_pending)
 
     def have_enough() -> bool:
         if len(successes) < selection.top_n:
             return False
-        return banking_count() >= selection.ai_banking_minimum_floor
+        return banking_successes >= selection.ai_banking_minimum_floor
+
+    def track(future: Future, sa: ScoredArticle) -> None:
+        nonlocal submitted, banking_pending
+        pending[future] = sa
+        submitted += 1
+        if _is_banking(sa):
+            banking_pending += 1
 
     def submit_next(*, allow_overflow: bool = False) -> bool:
         # Topic-aware submission. We reserve `ai_banking_minimum_floor` slots
@@ -221,7 +232,6 @@ def fetch_and_select(
         # Skipped non-banking candidates are stashed in `deferred_non_banking`
         # so the fallback pass can use them if banking turns out to be too
         # thin to meet the floor.
-        nonlocal submitted
         for sa in candidate_iter:
             domain = sa.article.domain or "unknown"
             if domain_success[domain] >= selection.max_articles_per_source:
@@ -241,15 +251,13 @@ def fetch_and_select(
                 retry_cfg=retry_cfg,
                 logger=logger,
             )
-            pending[future] = sa
-            submitted += 1
+            track(future, sa)
             return True
         return False
 
     def submit_next_deferred() -> bool:
-        nonlocal submitted
         while deferred_non_banking:
-            sa = deferred_non_banking.pop(0)
+            sa = deferred_non_banking.popleft()
             domain = sa.article.domain or "unknown"
             if domain_success[domain] >= selection.max_articles_per_source:
                 continue
@@ -261,14 +269,16 @@ def fetch_and_select(
                 retry_cfg=retry_cfg,
                 logger=logger,
             )
-            pending[future] = sa
-            submitted += 1
+            track(future, sa)
             return True
         return False
 
     def consume(fut: Future) -> None:
-        nonlocal failed
+        nonlocal failed, banking_successes, banking_pending
         sa = pending.pop(fut)
+        sa_is_banking = _is_banking(sa)
+        if sa_is_banking:
+            banking_pending -= 1
         try:
             outcome: _Outcome = fut.result()
         except BaseException as exc:
@@ -282,6 +292,8 @@ def fetch_and_select(
             if domain_success[domain] < selection.max_articles_per_source:
                 successes.append(outcome.scored)
                 domain_success[domain] += 1
+                if sa_is_banking:
+                    banking_successes += 1
         else:
             failed += 1
         if on_progress is not None:
@@ -334,20 +346,26 @@ def _trim_to_selection(
         degradation.add_warning("No articles successfully extracted.")
         return []
 
-    # Sort by final_score desc as the master order.
-    by_score = sorted(successes, key=lambda s: s.final_score, reverse=True)
-
-    banking = [s for s in by_score if _is_banking(s)]
+    # Only the best `floor` banking articles and the best `remaining_slots`
+    # fillers are ever read, so partial top-k selection is enough — no full
+    # sort of `successes`, and the caller's list is left untouched.
+    # `heapq.nlargest` is stable, matching `sorted(..., reverse=True)[:k]`.
+    banking = [s for s in successes if _is_banking(s)]
     floor = min(selection.ai_banking_minimum_floor, len(banking))
     n = selection.top_n
 
-    chosen = banking[:floor]
+    chosen = heapq.nlargest(floor, banking, key=_score_key)
     remaining_slots = max(0, n - len(chosen))
-    chosen_urls = {str(s.article.url) for s in chosen}
-    fillers = [s for s in by_score if str(s.article.url) not in chosen_urls][:remaining_slots]
+    # Same objects as in `successes`: identity membership, no URL stringify.
+    chosen_ids = {id(s) for s in chosen}
+    fillers = heapq.nlargest(
+        remaining_slots,
+        (s for s in successes if id(s) not in chosen_ids),
+        key=_score_key,
+    )
     chosen.extend(fillers)
 
-    chosen.sort(key=lambda s: s.final_score, reverse=True)
+    chosen.sort(key=_score_key, reverse=True)
 
     if floor < selection.ai_banking_minimum_floor:
         degradation.is_degraded = True
@@ -13,6 +13,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum, StrEnum
+from functools import cached_property
 from typing import Any
 from urllib.parse import urlparse
 
@@ -53,8 +54,15 @@ class Article(BaseModel):
     def _normalize_source(cls, v: Any) -> str:
         return str(v).strip() if v else "Unknown Source"
 
-    @property
+    @cached_property
     def domain(self) -> str:
+        """Lower-cased host of `url` without a leading `www.`.
+
+        Cached per instance because scoring, the per-source cap and rendering
+        all read it. The cache is not invalidated: reassigning `url`, or
+        `model_copy(update={"url": ...})` on an instance that has already
+        read `domain`, keeps the old host. Build a fresh `Article` instead.
+        """
         host = urlparse(str(self.url)).hostname or ""
         return host.lower().removeprefix("www.")
 
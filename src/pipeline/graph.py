@@ -168,6 +168,7 @@ def analyze(
         workers=settings.parallelism.analysis_workers,
         degradation=degradation,
         on_progress=progress,
+        cache_dir=ensure_cache_dir(settings.output.output_dir / "insight_cache"),
     )
 
 
@@ -205,10 +206,12 @@ def run_pipeline(settings: Settings) -> dict[str, object]:
         settings.parallelism.discovery_workers,
         settings.parallelism.extraction_workers,
     )
-    logger = SessionLogger(output_dir=settings.output.output_dir)
     degradation = DegradationStatus()
 
-    with BrowserPool(workers=workers) as pool:
+    with (
+        SessionLogger(output_dir=settings.output.output_dir) as logger,
+        BrowserPool(workers=workers) as pool,
+    ):
         candidates = discover(settings, pool, logger, degradation)
         scored = rank(settings, candidates)
         selected = fetch_select(settings, scored, pool, logger, degradation)
@@ -14,11 +14,11 @@ from __future__ import annotations
 from collections.abc import Iterable
 from datetime import UTC, date
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 from src.config import ScoringSettings, SourceSettings
 from src.discovery.publishers import classify_tier, tier_multiplier
-from src.models import Article, ScoredArticle, Topic
+from src.models import Article, ScoredArticle, SourceTier, Topic
 
 # Tier signal feeds the additive part — Tier 1 = 1.0, Tier 2 = 0.6, Tier 3 = 0.3.
 # This is independent from the multiplicative `source_tier_multiplier` applied
@@ -29,18 +29,28 @@ _TIER_SIGNAL = {1: 1.0, 2: 0.6, 3: 0.3}
 def topic_relevance(article: Article, topic_queries: dict[Topic, tuple[str, ...]]) -> float:
     """Best-match similarity between the article (title + snippet) and any
     query for any topic the article appeared under. Range [0, 1]."""
+    return _relevance(article, _lower_queries(topic_queries))
+
+
+def _lower_queries(topic_queries: dict[Topic, tuple[str, ...]]) -> dict[Topic, tuple[str, ...]]:
+    return {t: tuple(q.lower() for q in qs) for t, qs in topic_queries.items()}
+
+
+def _relevance(article: Article, lowered_queries: dict[Topic, tuple[str, ...]]) -> float:
+    """`topic_relevance` against queries already lowered by `_lower_queries`,
+    so a batch lowers each query once rather than once per article."""
     haystack = f"{article.title} {article.snippet}".strip().lower()
     if not haystack:
         return 0.0
 
     topics_to_check: Iterable[Topic] = article.appeared_in_topics or {article.discovered_via_topic}
-    best = 0.0
-    for t in topics_to_check:
-        for q in topic_queries.get(t, ()):
-            score = fuzz.token_set_ratio(haystack, q.lower()) / 100.0
-            if score > best:
-                best = score
-    return min(max(best, 0.0), 1.0)
+    queries = [q for t in topics_to_check for q in lowered_queries.get(t, ())]
+    # One C-level scan over every candidate query instead of a Python loop
+    # of scalar scorer calls.
+    match = process.extractOne(haystack, queries, scorer=fuzz.token_set_ratio)
+    if match is None:
+        return 0.0
+    return min(max(match[1] / 100.0, 0.0), 1.0)
 
 
 _CONSENSUS_SATURATION = 5
@@ -51,27 +61,75 @@ def cross_source_consensus(article: Article, all_articles: list[Article]) -> flo
 
     We approximate "same story" by fuzzy-matching titles across articles
     from different domains, since deduplication-by-URL has already happened.
-    Score saturates at 5 distinct co-covering outlets — we short-circuit
-    the inner loop once that's reached, since the score can't go higher.
+    Score saturates at 5 distinct co-covering outlets.
     """
-    title = article.title.lower()
+    titles = [a.title.lower() for a in all_articles]
+    domains = [a.domain for a in all_articles]
+    index = next((i for i, a in enumerate(all_articles) if a is article), None)
+    if index is None:
+        titles.append(article.title.lower())
+        domains.append(article.domain)
+        index = len(titles) - 1
+    return _consensus_at(index, titles, domains)
+
+
+_CONSENSUS_MIN_SIMILARITY = 75
+
+
+def _consensus_at(index: int, titles: list[str], domains: list[str]) -> float:
+    """`cross_source_consensus` over pre-lowered titles and pre-resolved
+    domains, laid out as parallel columns so a batch computes them once
+    instead of once per (article, other) pair.
+
+    The similarity scan is a single `process.extract` call: rapidfuzz runs
+    the loop over every other title in C and drops anything under the
+    cutoff before it reaches Python."""
+    title = titles[index]
     if not title:
         return 0.0
 
-    distinct_domains: set[str] = set()
-    for other in all_articles:
-        if other is article or other.domain == article.domain:
-            continue
-        if other.domain in distinct_domains:
-            continue
-        sim = fuzz.token_set_ratio(title, other.title.lower())
-        if sim >= 75:
-            distinct_domains.add(other.domain)
-            if len(distinct_domains) >= _CONSENSUS_SATURATION:
-                break
+    own_domain = domains[index]
+    matches = process.extract(
+        title,
+        titles,
+        scorer=fuzz.token_set_ratio,
+        score_cutoff=_CONSENSUS_MIN_SIMILARITY,
+        limit=None,
+    )
+    distinct_domains = {
+        domains[j] for _, _, j in matches if j != index and domains[j] != own_domain
+    }
     return min(len(distinct_domains) / _CONSENSUS_SATURATION, 1.0)
 
 
+def _consensus_all(titles: list[str], domains: list[str]) -> list[float]:
+    """`_consensus_at` for every index at once.
+
+    token_set_ratio is symmetric, so each unordered pair is scored once.
+    Row i is compared only against titles after it, and a match credits
+    both ends, which halves the similarity work of calling `_consensus_at`
+    per article."""
+    covering: list[set[str]] = [set() for _ in titles]
+    for i, title in enumerate(titles):
+        if not title:
+            continue
+        own_domain = domains[i]
+        matches = process.extract(
+            title,
+            titles[i + 1 :],
+            scorer=fuzz.token_set_ratio,
+            score_cutoff=_CONSENSUS_MIN_SIMILARITY,
+            limit=None,
+        )
+        for _, _, offset in matches:
+            j = i + 1 + offset
+            other_domain = domains[j]
+            if other_domain != own_domain:
+                covering[i].add(other_domain)
+                covering[j].add(own_domain)
+    return [min(len(c) / _CONSENSUS_SATURATION, 1.0) for c in covering]
+
+
 def recency_score(article: Article, date_from: date, date_to: date) -> float:
     """Linear recency curve within [date_from, date_to]. 1.0 at the end of
     the window, 0.0 at the start. Articles without a published_time get
@@ -110,22 +168,44 @@ def score_articles(
     if not articles:
         return []
 
+    # Bind the weights once; the loop below reads locals, not attribute
+    # lookups on the settings dataclass for every candidate.
+    w_topic = scoring.weight_topic_relevance
+    w_consensus = scoring.weight_cross_source_consensus
+    w_tier = scoring.weight_source_tier
+    w_recency = scoring.weight_recency
+
+    lowered_queries = _lower_queries(topic_queries)
+
+    # Columns read by the O(N²) consensus pass, materialised once per batch.
+    titles = [a.title.lower() for a in articles]
+    domains = [a.domain for a in articles]
+    consensus_scores = _consensus_all(titles, domains)
+
+    # Tier lookups depend only on the domain, and a month of candidates
+    # repeats the same few dozen outlets — resolve each domain once.
+    tier_by_domain: dict[str, tuple[SourceTier, float, float]] = {}
+
     # Pre-compute tier and recency for every article.
     scored: list[ScoredArticle] = []
-    for art in articles:
-        tier = classify_tier(art.domain, sources)
-        mult = tier_multiplier(tier, sources)
-        tier_sig = _TIER_SIGNAL[int(tier)]
-
-        topic_score = topic_relevance(art, topic_queries)
-        consensus = cross_source_consensus(art, articles)
+    for i, art in enumerate(articles):
+        domain = domains[i]
+        tier_info = tier_by_domain.get(domain)
+        if tier_info is None:
+            tier = classify_tier(domain, sources)
+            tier_info = (tier, tier_multiplier(tier, sources), _TIER_SIGNAL[int(tier)])
+            tier_by_domain[domain] = tier_info
+        tier, mult, tier_sig = tier_info
+
+        topic_score = _relevance(art, lowered_queries)
+        consensus = consensus_scores[i]
         rec = recency_score(art, date_from, date_to)
 
         weighted = (
-            scoring.weight_topic_relevance * topic_score
-            + scoring.weight_cross_source_consensus * consensus
-            + scoring.weight_source_tier * tier_sig
-            + scoring.weight_recency * rec
+            w_topic * topic_score
+            + w_consensus * consensus
+            + w_tier * tier_sig
+            + w_recency * rec
         )
         final = weighted * mult
 
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import time
 from collections.abc import Iterable
 from datetime import datetime
 
 import pytest
+from langchain_core.runnables import RunnableLambda
 
 from src.config import (
     ScoringSettings,
     SelectionSettings,
     SourceSettings,
 )
+from src.analysis.insights import _InsightPayload
 from src.models import Article, Topic
 
 
@@ -37,6 +40,38 @@ def make_article(
     )
 
 
+class FakeChatModel:
+    """Stand-in for the Azure chat model. Its structured-output runnable
+    answers with a bullet naming the article title, sleeps longer for shorter
+    bodies (so completion order differs from dispatch order), raises for
+    `fail_title` and returns no bullets for `empty_title`."""
+
+    deployment_name = "fake"
+    temperature = 0.0
+
+    def __init__(self, fail_title: str | None = None, empty_title: str | None = None) -> None:
+        self.fail_title = fail_title
+        self.empty_title = empty_title
+        self.seen_titles: list[str] = []
+
+    def with_structured_output(self, schema):
+        assert schema is _InsightPayload
+
+        def answer(prompt_value) -> _InsightPayload:
+            user = prompt_value.to_messages()[-1].content
+            title = user.split("\n", 1)[0].removeprefix("Article title: ")
+            body = user.split("---\n", 1)[1]
+            self.seen_titles.append(title)
+            time.sleep(0.05 / max(len(body), 1))
+            if title == self.fail_title:
+                raise RuntimeError("model unavailable")
+            if title == self.empty_title:
+                return _InsightPayload(insights=[])
+            return _InsightPayload(insights=[f"about {title}"])
+
+        return RunnableLambda(answer)
+
+
 @pytest.fixture
 def source_settings() -> SourceSettings:
     return SourceSettings(
@@ -69,3 +69,13 @@ def test_classify_exception_timeout():
     c = classify_exception(FakeTimeout("nav timeout"))
     assert c.type is BlockType.TIMEOUT
     assert c.retryable
+
+
+def test_captcha_marker_match_is_case_insensitive():
+    c = classify_text("<html><div id='CF-Challenge'>Checking...</div></html>")
+    assert c.type is BlockType.CAPTCHA
+    assert c.reason == "matched 'cf-challenge'"
+
+
+def test_whitespace_only_body_classified_as_empty():
+    assert classify_text("  \n\t ").type is BlockType.EMPTY_BODY
@@ -194,3 +194,26 @@ def test_format_pub_date_handles_missing_and_unknown(tmp_path):
     assert gen._format_pub_date("not-a-date") == "not-a-date"
     from datetime import datetime
     assert gen._format_pub_date(datetime(2026, 4, 22)) == "April 22, 2026"
+
+
+def test_email_escapes_scraped_fields(tmp_path):
+    gen = DocumentGenerator(output_dir=tmp_path, month_label="April 2026")
+    articles = [
+        {
+            "article": {
+                "title": "AT&T <b>bets</b> on AI",
+                "source": "Q&A Weekly",
+                "published_time": "2026-04-15T10:00:00Z",
+                "url": "https://example.com/a?x=1&y=2",
+            },
+            "analysis": {"insights": ["Margins <10% for now."]},
+        }
+    ]
+    path = gen.generate_email_content(articles)
+    with open(path, encoding="utf-8") as f:
+        html = f.read()
+    assert "AT&amp;T &lt;b&gt;bets&lt;/b&gt; on AI" in html
+    assert "Q&amp;A Weekly" in html
+    assert 'href="https://example.com/a?x=1&amp;y=2"' in html
+    assert "Margins &lt;10% for now." in html
+    assert "<b>bets</b>" not in html
@@ -135,6 +135,13 @@ def test_parser_extracts_relative_pub_time():
     assert 13 <= delta.days <= 15
 
 
+def test_parser_dates_relative_times_against_given_now():
+    now = datetime(2026, 5, 9, 12, 0, 0)
+    html = f"<html><body>{_build_card(title='Bank deal of the year', source='FT', time_text='2 weeks ago', snippet='Snippet text', url='https://ft.com/bank-deal')}</body></html>"
+    cards = parse_google_news_html(html, now=now)
+    assert cards[0]["published_time"] == now - timedelta(weeks=2)
+
+
 def test_parser_strips_time_when_in_anchor_text_fallback():
     """When there's no role=heading, the parser falls back to anchor text.
     Time markers must still be stripped."""
@@ -182,3 +189,8 @@ def test_parser_skips_google_internal_links():
     urls = [c["url"] for c in cards]
     assert all("google.com" not in u for u in urls)
     assert "https://realsite.com/article" in urls
+
+
+def test_parse_absolute_rejects_impossible_day():
+    assert _parse_pub_time("Feb 30, 2026") is None
+    assert _parse_pub_time("2026-02-30") is None
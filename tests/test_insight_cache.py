@@ -0,0 +1,57 @@
+"""Tests for the insight cache key and its on-disk read/write helpers.
+
+A stand-in object carries only the attributes the cache key reads.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from src.analysis.insights import insight_cache_key, read_insight_cache, write_insight_cache
+from src.models import ArticleAnalysis
+from tests.conftest import make_article
+
+_LLM = SimpleNamespace(deployment_name="gpt-test", temperature=0.2)
+
+
+def test_cache_key_changes_with_body_and_model():
+    art = make_article(url="http://a.com/1", title="Bank adopts agents")
+    art.markdown = "Body one"
+    base = insight_cache_key(_LLM, art, max_article_chars=1000)
+
+    art.markdown = "Body two"
+    assert insight_cache_key(_LLM, art, max_article_chars=1000) != base
+
+    art.markdown = "Body one"
+    other = SimpleNamespace(deployment_name="gpt-other", temperature=0.2)
+    assert insight_cache_key(other, art, max_article_chars=1000) != base
+    assert insight_cache_key(_LLM, art, max_article_chars=1000) == base
+
+
+def test_cache_key_covers_payload_schema(monkeypatch):
+    art = make_article(url="http://a.com/1", title="Bank adopts agents")
+    base = insight_cache_key(_LLM, art, max_article_chars=1000)
+    monkeypatch.setattr(
+        "src.analysis.insights._InsightPayload.model_json_schema",
+        classmethod(lambda cls, *a, **k: {"changed": True}),
+    )
+    assert insight_cache_key(_LLM, art, max_article_chars=1000) != base
+
+
+def test_write_then_read_round_trips(tmp_path):
+    write_insight_cache(tmp_path, "abc", ArticleAnalysis(insights=["cached bullet"]))
+    assert read_insight_cache(tmp_path, "abc").insights == ["cached bullet"]
+
+
+def test_missing_entry_reads_as_miss(tmp_path):
+    assert read_insight_cache(tmp_path, "absent") is None
+
+
+def test_corrupt_cache_entry_reads_as_miss(tmp_path):
+    (tmp_path / "deadbeef.json").write_text("{not json", encoding="utf-8")
+    assert read_insight_cache(tmp_path, "deadbeef") is None
+
+
+def test_write_leaves_no_temp_files(tmp_path):
+    write_insight_cache(tmp_path, "abc", ArticleAnalysis(insights=["x"]))
+    assert [p.name for p in tmp_path.iterdir()] == ["abc.json"]
@@ -299,3 +299,14 @@ def test_trim_helper_prefers_banking_then_score(selection_settings):
     # Sorted descending by score
     scores = [s.final_score for s in out]
     assert scores == sorted(scores, reverse=True)
+
+
+def test_trim_helper_does_not_reorder_input(selection_settings):
+    successes = [
+        _scored(url=f"http://s{i}.example/1", score=float(i), banking=i % 3 == 0)
+        for i in range(15)
+    ]
+    before = [str(s.article.url) for s in successes]
+    out = _trim_to_selection(successes, selection_settings, DegradationStatus())
+    assert [str(s.article.url) for s in successes] == before
+    assert [s.final_score for s in out] == sorted((s.final_score for s in out), reverse=True)
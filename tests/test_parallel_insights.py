@@ -0,0 +1,117 @@
+"""Tests for `generate_insights_parallel` over the batched dispatch.
+
+`FakeChatModel` stands in for Azure OpenAI, so dispatch order, result
+mapping, failures and the insight cache are exercised end to end.
+"""
+
+from __future__ import annotations
+
+from src.analysis import parallel_insights
+from src.analysis.insights import insight_cache_key, write_insight_cache
+from src.analysis.parallel_insights import generate_insights_parallel
+from src.models import ArticleAnalysis, DegradationStatus, ScoredArticle
+from tests.conftest import FakeChatModel, make_article
+
+
+def _selected(n: int) -> list[ScoredArticle]:
+    out = []
+    for i in range(n):
+        art = make_article(url=f"http://s{i}.com/a", title=f"Story {i}")
+        # Body length rises with i, so dispatch (longest first) reverses input order.
+        art.markdown = "x" * (10 * (i + 1))
+        out.append(ScoredArticle(article=art))
+    return out
+
+
+def test_results_land_on_their_own_article_despite_reordering():
+    selected = _selected(5)
+    llm = FakeChatModel()
+    generate_insights_parallel(
+        llm, selected, max_article_chars=1000, workers=5, degradation=DegradationStatus()
+    )
+    for sa in selected:
+        assert sa.analysis.insights == [f"about {sa.article.title}"]
+
+
+def test_dispatch_is_longest_body_first():
+    selected = _selected(3)
+    llm = FakeChatModel()
+    generate_insights_parallel(
+        llm, selected, max_article_chars=1000, workers=1, degradation=DegradationStatus()
+    )
+    assert llm.seen_titles == ["Story 2", "Story 1", "Story 0"]
+    for sa in selected:
+        assert sa.analysis.insights == [f"about {sa.article.title}"]
+
+
+def test_cache_hits_skip_dispatch_and_misses_map_back(tmp_path):
+    selected = _selected(4)
+    llm = FakeChatModel()
+    for i in (0, 2):
+        key = insight_cache_key(llm, selected[i].article, max_article_chars=1000)
+        write_insight_cache(tmp_path, key, ArticleAnalysis(insights=[f"cached {i}"]))
+
+    generate_insights_parallel(
+        llm,
+        selected,
+        max_article_chars=1000,
+        workers=2,
+        degradation=DegradationStatus(),
+        cache_dir=tmp_path,
+    )
+    assert selected[0].analysis.insights == ["cached 0"]
+    assert selected[2].analysis.insights == ["cached 2"]
+    assert selected[1].analysis.insights == ["about Story 1"]
+    assert selected[3].analysis.insights == ["about Story 3"]
+    assert sorted(llm.seen_titles) == ["Story 1", "Story 3"]
+
+
+def test_empty_completion_is_not_cached(tmp_path):
+    selected = _selected(2)
+    generate_insights_parallel(
+        FakeChatModel(empty_title="Story 0"),
+        selected,
+        max_article_chars=1000,
+        workers=2,
+        degradation=DegradationStatus(),
+        cache_dir=tmp_path,
+    )
+    assert selected[0].analysis.insights == []
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_cache_write_failure_degrades_instead_of_raising(tmp_path, monkeypatch):
+    def boom(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(parallel_insights, "write_insight_cache", boom)
+    selected = _selected(1)
+    degradation = DegradationStatus()
+    generate_insights_parallel(
+        FakeChatModel(),
+        selected,
+        max_article_chars=1000,
+        workers=1,
+        degradation=degradation,
+        cache_dir=tmp_path,
+    )
+    assert selected[0].analysis.insights == ["about Story 0"]
+    assert any("disk full" in w for w in degradation.warnings)
+
+
+def test_one_failing_call_degrades_only_that_article():
+    selected = _selected(4)
+    degradation = DegradationStatus()
+    generate_insights_parallel(
+        FakeChatModel(fail_title="Story 2"),
+        selected,
+        max_article_chars=1000,
+        workers=4,
+        degradation=degradation,
+    )
+    assert selected[2].analysis.insights == []
+    for i in (0, 1, 3):
+        assert selected[i].analysis.insights == [f"about Story {i}"]
+    assert degradation.failed_attempts == 1
+    assert len(degradation.warnings) == 1
+    assert "Story 2" in degradation.warnings[0]
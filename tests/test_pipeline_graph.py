@@ -0,0 +1,33 @@
+"""Tests for the pipeline stage functions in `src.pipeline.graph`."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from src.analysis import parallel_insights
+from src.models import DegradationStatus, ScoredArticle
+from src.pipeline import graph
+from tests.conftest import FakeChatModel, make_article
+
+
+def test_analyze_finishes_when_insight_cache_write_fails(tmp_path, monkeypatch):
+    def boom(*args, **kwargs):
+        raise OSError("read-only file system")
+
+    monkeypatch.setattr(graph, "build_chat_model", lambda azure, llm: FakeChatModel())
+    monkeypatch.setattr(parallel_insights, "write_insight_cache", boom)
+    settings = SimpleNamespace(
+        azure=None,
+        llm=SimpleNamespace(max_article_chars=1000),
+        parallelism=SimpleNamespace(analysis_workers=2),
+        output=SimpleNamespace(output_dir=tmp_path),
+    )
+    art = make_article(url="http://a.com/1", title="Bank adopts agents")
+    art.markdown = "Body"
+    degradation = DegradationStatus()
+
+    out = graph.analyze(settings, [ScoredArticle(article=art)], degradation)
+
+    assert out[0].analysis.insights == ["about Bank adopts agents"]
+    assert (tmp_path / "insight_cache").is_dir()
+    assert any("read-only file system" in w for w in degradation.warnings)
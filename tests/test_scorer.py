@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import date, datetime
 
+from src.discovery.publishers import classify_tier
 from src.models import SourceTier, Topic
 from src.ranking.scorer import (
     cross_source_consensus,
@@ -108,3 +109,31 @@ def test_score_articles_orders_descending(scoring_settings, source_settings):
     assert scored[0].article.title.startswith("AI banking")
     assert scored[0].source_tier == SourceTier.TIER_1
     assert scored[0].final_score > scored[1].final_score
+
+
+def test_score_articles_consensus_matches_per_article_helper(scoring_settings, source_settings):
+    arts = [
+        make_article(url="http://a.com/1", title="OpenAI launches new model"),
+        make_article(url="http://b.com/1", title="OpenAI launches a new model"),
+        make_article(url="http://c.com/1", title="OpenAI launches new model today"),
+        make_article(url="http://a.com/2", title="OpenAI launches a new model now"),
+        make_article(url="http://d.com/1", title="Cooking tips for fall"),
+    ]
+    scored = score_articles(
+        arts,
+        topic_queries=TOPIC_QUERIES,
+        scoring=scoring_settings,
+        sources=source_settings,
+        date_from=date(2026, 4, 1),
+        date_to=date(2026, 4, 30),
+    )
+    by_url = {str(s.article.url): s.cross_source_consensus for s in scored}
+    for art in arts:
+        assert by_url[str(art.url)] == cross_source_consensus(art, arts)
+
+
+def test_classify_tier_matches_subdomains_only_at_label_boundaries(source_settings):
+    assert classify_tier("markets.ft.com", source_settings) == SourceTier.TIER_1
+    assert classify_tier("www.Forbes.com", source_settings) == SourceTier.TIER_2
+    assert classify_tier("notft.com", source_settings) == SourceTier.TIER_3
+    assert classify_tier("", source_settings) == SourceTier.TIER_3